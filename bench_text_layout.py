@@ -0,0 +1,99 @@
+"""Benchmark the text layout pass over a generated 10k-row batch CSV.
+
+Run with: python bench_text_layout.py [rows]
+"""
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from PIL import Image, ImageDraw
+from card_generator import CardGenerator
+
+FIELDS = ['name', 'job_title', 'company', 'email', 'phone', 'website', 'address']
+
+
+def write_csv(path, rows, long_fields):
+    """Write a batch CSV with repeated companies, titles and addresses"""
+    rng = random.Random(1)
+    if long_fields:
+        companies = [f"Acme Holdings International Group {i}" for i in range(50)]
+        titles = ["Senior Vice President of Global Strategic Partnerships", "Chief Executive Officer",
+                  "Principal Software Engineer", "Head of Sales"]
+        addresses = [f"{i} Very Long Boulevard Name, Suite {i * 3}, Metropolis City, State 12345, United Kingdom"
+                     for i in range(200)]
+    else:
+        companies = [f"Acme {i}" for i in range(50)]
+        titles = ["CEO", "Engineer", "Head of Sales", "Designer"]
+        addresses = [f"{i} Main St, Springfield" for i in range(200)]
+
+    with open(path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, FIELDS)
+        writer.writeheader()
+        for i in range(rows):
+            name = f"Firstname{i} Extremely-Long-Surname Person" if long_fields else f"Jane Doe {i}"
+            writer.writerow({
+                'name': name,
+                'job_title': rng.choice(titles),
+                'company': rng.choice(companies),
+                'email': f"person{i}@example-company.com",
+                'phone': '+1 555 0100',
+                'website': 'https://www.example-company.com',
+                'address': rng.choice(addresses),
+            })
+
+
+def read_csv(path):
+    """Read rows the same way routes.batch_upload does"""
+    with open(path, 'r', encoding='utf-8') as csvfile:
+        return list(csv.DictReader(csvfile))
+
+
+def time_layout(rows):
+    """Time fit() alone for the executive_premium slots"""
+    generator = CardGenerator()
+    layout = generator.text_layout
+    text_width = generator.card_width - 120 - 50 - 20
+    slots = [('name', 'serif_elegant', 72, 1), ('job_title', 'sans_modern', 36, 1),
+             ('company', 'sans_modern', 36, 1), ('email', 'sans_modern', 28, 1),
+             ('phone', 'sans_modern', 28, 1), ('website', 'sans_modern', 28, 1),
+             ('address', 'sans_modern', 28, 2)]
+    start = time.perf_counter()
+    for row in rows:
+        for field, font_family, size, max_lines in slots:
+            layout.fit(row[field], font_family, size, text_width, max_lines)
+    return time.perf_counter() - start, len(layout._lengths)
+
+
+def time_apply_template(rows, template):
+    """Time apply_template (layout plus drawing) on one generator"""
+    generator = CardGenerator()
+    colors = generator.color_schemes['executive_navy']
+    draw = ImageDraw.Draw(Image.new('RGB', (generator.card_width, generator.card_height)))
+    start = time.perf_counter()
+    for row in rows:
+        generator.apply_template(draw, row, colors, template)
+    return time.perf_counter() - start
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for long_fields in (False, True):
+            label = 'long fields' if long_fields else 'short fields'
+            path = os.path.join(tmpdir, f"batch_{'long' if long_fields else 'short'}.csv")
+            write_csv(path, rows, long_fields)
+            cards = read_csv(path)
+
+            layout_time, measurements = time_layout(cards)
+            print(f"{label}: {len(cards)} rows")
+            print(f"  {'layout pass:':<20}{layout_time:.2f}s total, "
+                  f"{layout_time / len(cards) * 1e6:.0f}us/card, {measurements} real measurements")
+            for template in ('executive_premium', 'minimalist_pro'):
+                template_time = time_apply_template(cards, template)
+                print(f"  {template + ':':<20}{template_time / len(cards) * 1e3:.2f}ms/card")
+
+
+if __name__ == '__main__':
+    main()
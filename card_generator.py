@@ -9,6 +9,186 @@ import qrcode
 from io import BytesIO
 import base64
 
+class TextLayout:
+    """Measure, shrink and wrap text to fit a slot, memoizing every measurement"""
+
+    def __init__(self, font_loader, min_scale=0.6, tolerance=0.02):
+        self.font_loader = font_loader
+        self.min_scale = min_scale
+        # Kerning can move a string's real width away from the summed
+        # per-character advances; inside this band the string is measured
+        self.tolerance = tolerance
+        # Scratch canvas used only for measuring
+        self._draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+        self._lengths = {}
+        self._char_widths = {}
+        self._line_heights = {}
+        self._fits = {}
+
+    def text_length(self, font_family, size, text):
+        """Advance width of text, measured once per (font, size, text)"""
+        key = (font_family, size, text)
+        length = self._lengths.get(key)
+        if length is None:
+            font = self.font_loader(font_family, size)
+            length = self._draw.textlength(text, font=font)
+            self._lengths[key] = length
+        return length
+
+    def line_height(self, font_family, size):
+        """Line advance for a font, measured once per (font, size)"""
+        key = (font_family, size)
+        height = self._line_heights.get(key)
+        if height is None:
+            font = self.font_loader(font_family, size)
+            left, top, right, bottom = self._draw.textbbox((0, 0), 'Ag', font=font)
+            height = int((bottom - top) * 1.25)
+            self._line_heights[key] = height
+        return height
+
+    def char_widths(self, font_family, size):
+        """Per-character advance table for a font, filled lazily"""
+        key = (font_family, size)
+        widths = self._char_widths.get(key)
+        if widths is None:
+            widths = self._char_widths[key] = {}
+        return widths
+
+    def estimate_length(self, font_family, size, text):
+        """Approximate width as the sum of per-character advances.
+
+        Characters repeat across every field of a batch, so this is answered
+        from the cache almost immediately; borderline results are confirmed
+        with a real text_length measurement.
+        """
+        widths = self.char_widths(font_family, size)
+        total = 0
+        for char in text:
+            width = widths.get(char)
+            if width is None:
+                width = widths[char] = self.text_length(font_family, size, char)
+            total += width
+        return total
+
+    def fits_width(self, font_family, size, text, max_width):
+        """Whether text fits max_width, measuring only when the estimate is borderline"""
+        estimate = self.estimate_length(font_family, size, text)
+        if estimate <= max_width * (1 - self.tolerance):
+            return True
+        if estimate > max_width * (1 + self.tolerance):
+            return False
+        return self.text_length(font_family, size, text) <= max_width
+
+    def _wrap(self, text, font_family, size, max_width):
+        """Greedy word wrap on estimated widths; lines may still overflow individually"""
+        space = self.estimate_length(font_family, size, ' ')
+        lines = []
+        current = []
+        current_width = 0
+        for word in text.split():
+            word_width = self.estimate_length(font_family, size, word)
+            if current and current_width + space + word_width > max_width:
+                lines.append(' '.join(current))
+                current = [word]
+                current_width = word_width
+            else:
+                current_width += (space if current else 0) + word_width
+                current.append(word)
+        if current:
+            lines.append(' '.join(current))
+        return lines
+
+    def _truncate(self, text, font_family, size, max_width):
+        """Trim text and append an ellipsis until it fits max_width"""
+        if self.fits_width(font_family, size, text, max_width):
+            return text
+        # Pick the cut from per-character advances, leaving the tolerance
+        # margin so the result normally needs no real measurement
+        limit = max_width * (1 - self.tolerance)
+        total = self.estimate_length(font_family, size, '\u2026')
+        cut = 0
+        for char in text:
+            total += self.estimate_length(font_family, size, char)
+            if total > limit:
+                break
+            cut += 1
+        while cut > 0 and not self.fits_width(font_family, size, text[:cut] + '\u2026', max_width):
+            cut -= 1
+        return text[:cut].rstrip() + '\u2026'
+
+    def _shrink(self, text, font_family, size, min_size, max_width):
+        """Largest size >= min_size at which text fits on one line, or None"""
+        estimate = self.estimate_length(font_family, size, text)
+        # Advance width scales almost linearly with font size, so jump straight
+        # to the estimate and step down only to correct for hinting
+        candidate = size if estimate <= max_width else min(size - 1, int(size * max_width / estimate))
+        while candidate >= min_size:
+            if self.fits_width(font_family, candidate, text, max_width):
+                return candidate
+            candidate -= 1
+        return None
+
+    def fit(self, text, font_family, size, max_width, max_lines=1):
+        """Return (size, lines) so text fits max_width in at most max_lines lines.
+
+        The font is shrunk down to min_scale of the requested size; if the text
+        still does not fit it is wrapped (when max_lines > 1) and the last line
+        is truncated with an ellipsis. Newlines in the text are hard line
+        breaks counted against max_lines.
+        """
+        key = (text, font_family, size, max_width, max_lines)
+        result = self._fits.get(key)
+        if result is not None:
+            return result
+
+        min_size = max(1, int(size * self.min_scale))
+        # textlength rejects multiline strings, so split on line breaks and
+        # collapse the remaining whitespace before measuring anything
+        parts = [' '.join(part.split()) for part in text.splitlines()]
+        parts = [part for part in parts if part] or ['']
+        if len(parts) > max_lines:
+            parts = parts[:max_lines - 1] + [' '.join(parts[max_lines - 1:])]
+
+        if len(parts) == 1:
+            result = self._fit_paragraph(parts[0], font_family, size, min_size, max_width, max_lines)
+        else:
+            # One line per part, all drawn at the largest size every part fits
+            sizes = [self._shrink(part, font_family, size, min_size, max_width) for part in parts]
+            fitted_size = min(min_size if part_size is None else part_size for part_size in sizes)
+            lines = tuple(self._truncate(part, font_family, fitted_size, max_width) for part in parts)
+            result = (fitted_size, lines)
+
+        self._fits[key] = result
+        return result
+
+    def _fit_paragraph(self, text, font_family, size, min_size, max_width, max_lines):
+        """Fit a single paragraph (no hard line breaks)"""
+        fitted_size = self._shrink(text, font_family, size, min_size, max_width)
+        result = None if fitted_size is None else (fitted_size, (text,))
+        if max_lines > 1 and fitted_size != size:
+            # Wrapping may keep a larger size than shrinking onto one line, so
+            # try every size above the one-line result. The wrapped lines hold
+            # at most max_lines * max_width, so sizes above that estimate
+            # cannot fit
+            floor = min_size if fitted_size is None else fitted_size + 1
+            estimate = self.estimate_length(font_family, size, text)
+            candidate = min(size, int(size * max_lines * max_width / estimate))
+            while candidate >= floor:
+                lines = self._wrap(text, font_family, candidate, max_width)
+                if len(lines) <= max_lines and all(
+                        self.fits_width(font_family, candidate, line, max_width) for line in lines):
+                    result = (candidate, tuple(lines))
+                    break
+                candidate -= 1
+        if result is None:
+            lines = self._wrap(text, font_family, min_size, max_width) if max_lines > 1 else [text]
+            if len(lines) > max_lines:
+                lines = lines[:max_lines - 1] + [' '.join(lines[max_lines - 1:])]
+            lines = [self._truncate(line, font_family, min_size, max_width) for line in lines]
+            result = (min_size, tuple(lines))
+        return result
+
+
 class CardGenerator:
     def __init__(self):
         self.card_width = 1050  # 3.5" at 300 DPI
@@ -75,9 +255,22 @@ class CardGenerator:
             'mono_tech': 'DejaVuSansMono-Bold',
             'script_luxury': 'DejaVuSerif-Bold'
         }
+        
+        # Loaded fonts and text measurements are reused across cards in a batch
+        self._font_cache = {}
+        self.text_layout = TextLayout(self.get_font)
 
     def get_font(self, font_family, size):
-        """Get font with fallback to default"""
+        """Get font with fallback to default, cached per (family, size)"""
+        key = (font_family, size)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = self._load_font(font_family, size)
+            self._font_cache[key] = font
+        return font
+
+    def _load_font(self, font_family, size):
+        """Load font from disk with fallback to default"""
         font_name = self.fonts.get(font_family, 'DejaVuSans-Bold')
         try:
             return ImageFont.truetype(f"/usr/share/fonts/truetype/dejavu/{font_name}.ttf", size)
@@ -89,6 +282,17 @@ class CardGenerator:
             except:
                 return ImageFont.load_default()
 
+    def draw_fitted_text(self, draw, position, text, fill, font_family, size, max_width, max_lines=1):
+        """Draw text shrunk/wrapped to fit max_width; returns the number of lines drawn"""
+        fitted_size, lines = self.text_layout.fit(text, font_family, size, max_width, max_lines)
+        font = self.get_font(font_family, fitted_size)
+        line_height = self.text_layout.line_height(font_family, fitted_size)
+        x, y = position
+        for line in lines:
+            draw.text((x, y), line, fill=fill, font=font)
+            y += line_height
+        return len(lines)
+
     def create_gradient(self, width, height, color1, color2, direction='horizontal'):
         """Create gradient background"""
         base = Image.new('RGB', (width, height), color1)
@@ -140,26 +344,29 @@ END:VCARD"""
             draw.rectangle([0, 0, width, height], fill=colors['primary'])
             
             # Text positioning with larger fonts
-            name_font = self.get_font('serif_elegant', 72)
-            title_font = self.get_font('sans_modern', 36)
-            contact_font = self.get_font('sans_modern', 28)
+            name_style = ('serif_elegant', 72)
+            title_style = ('sans_modern', 36)
+            contact_style = ('sans_modern', 28)
+            # Keep text clear of the logo/QR column on the right
+            text_width = width - 120 - 50 - 20
             
             # Name
             if card_data.get('name'):
-                draw.text((50, 50), card_data.get('name', ''), fill=colors['text'], font=name_font)
+                self.draw_fitted_text(draw, (50, 50), card_data['name'], colors['text'], *name_style, text_width)
             # Title
             if card_data.get('job_title'):
-                draw.text((50, 140), card_data.get('job_title', ''), fill=colors['accent'], font=title_font)
+                self.draw_fitted_text(draw, (50, 140), card_data['job_title'], colors['accent'], *title_style, text_width)
             # Company
             if card_data.get('company'):
-                draw.text((50, 185), card_data.get('company', ''), fill=colors['highlight'], font=title_font)
+                self.draw_fitted_text(draw, (50, 185), card_data['company'], colors['highlight'], *title_style, text_width)
             
             # Contact info with better spacing
             y_pos = 230
             for field in ['email', 'phone', 'website', 'address']:
                 if card_data.get(field):
-                    draw.text((50, y_pos), card_data[field], fill=colors['light'], font=contact_font)
-                    y_pos += 50
+                    lines = self.draw_fitted_text(draw, (50, y_pos), card_data[field], colors['light'], *contact_style, text_width,
+                                                   max_lines=2 if field == 'address' else 1)
+                    y_pos += 50 * lines
             
             # Logo placement (top right)
             if logo_img:
@@ -179,23 +386,26 @@ END:VCARD"""
             overlays.append((gradient_img, (0, 0)))
             
             # Add text on gradient with larger fonts
-            name_font = self.get_font('sans_modern', 68)
-            title_font = self.get_font('sans_modern', 34)
-            contact_font = self.get_font('sans_modern', 26)
+            name_style = ('sans_modern', 68)
+            title_style = ('sans_modern', 34)
+            contact_style = ('sans_modern', 26)
+            # Keep text clear of the logo/QR column on the right
+            text_width = width - 110 - 50 - 20
             
             if card_data.get('name'):
-                draw.text((50, 50), card_data.get('name', ''), fill='white', font=name_font)
+                self.draw_fitted_text(draw, (50, 50), card_data['name'], 'white', *name_style, text_width)
             if card_data.get('job_title'):
-                draw.text((50, 135), card_data.get('job_title', ''), fill='white', font=title_font)
+                self.draw_fitted_text(draw, (50, 135), card_data['job_title'], 'white', *title_style, text_width)
             if card_data.get('company'):
-                draw.text((50, 180), card_data.get('company', ''), fill='white', font=title_font)
+                self.draw_fitted_text(draw, (50, 180), card_data['company'], 'white', *title_style, text_width)
             
             # Contact info for gradient template with better spacing
             y_pos = 210
             for field in ['email', 'phone', 'website', 'address']:
                 if card_data.get(field):
-                    draw.text((50, y_pos), card_data[field], fill='white', font=contact_font)
-                    y_pos += 42
+                    lines = self.draw_fitted_text(draw, (50, y_pos), card_data[field], 'white', *contact_style, text_width,
+                                                   max_lines=2 if field == 'address' else 1)
+                    y_pos += 42 * lines
             
             # Logo and QR for gradient template
             if logo_img:
@@ -215,23 +425,26 @@ END:VCARD"""
             
             # Black text on white with larger fonts
             text_color = '#000000'
-            name_font = self.get_font('sans_modern', 64)
-            title_font = self.get_font('sans_modern', 32)
-            contact_font = self.get_font('sans_modern', 26)
+            name_style = ('sans_modern', 64)
+            title_style = ('sans_modern', 32)
+            contact_style = ('sans_modern', 26)
+            # Keep text clear of the logo/QR column on the right
+            text_width = width - 100 - 30 - 20
             
             if card_data.get('name'):
-                draw.text((30, 30), card_data.get('name', ''), fill=text_color, font=name_font)
+                self.draw_fitted_text(draw, (30, 30), card_data['name'], text_color, *name_style, text_width)
             if card_data.get('job_title'):
-                draw.text((30, 110), card_data.get('job_title', ''), fill=colors['primary'], font=title_font)
+                self.draw_fitted_text(draw, (30, 110), card_data['job_title'], colors['primary'], *title_style, text_width)
             if card_data.get('company'):
-                draw.text((30, 150), card_data.get('company', ''), fill=colors['accent'], font=title_font)
+                self.draw_fitted_text(draw, (30, 150), card_data['company'], colors['accent'], *title_style, text_width)
                 
             # Contact info with improved spacing
             y_pos = 180
             for field in ['email', 'phone', 'website', 'address']:
                 if card_data.get(field):
-                    draw.text((30, y_pos), card_data[field], fill=text_color, font=contact_font)
-                    y_pos += 40
+                    lines = self.draw_fitted_text(draw, (30, y_pos), card_data[field], text_color, *contact_style, text_width,
+                                                   max_lines=2 if field == 'address' else 1)
+                    y_pos += 40 * lines
             
             # Logo and QR for minimalist template
             if logo_img:
@@ -247,23 +460,26 @@ END:VCARD"""
         else:
             # Default template - fallback
             draw.rectangle([0, 0, width, height], fill=colors['primary'])
-            name_font = self.get_font('sans_modern', 60)
-            title_font = self.get_font('sans_modern', 30)
-            contact_font = self.get_font('sans_modern', 24)
+            name_style = ('sans_modern', 60)
+            title_style = ('sans_modern', 30)
+            contact_style = ('sans_modern', 24)
+            # Keep text clear of the logo/QR column on the right
+            text_width = width - 105 - 50 - 20
             
             if card_data.get('name'):
-                draw.text((50, 45), card_data.get('name', ''), fill=colors['text'], font=name_font)
+                self.draw_fitted_text(draw, (50, 45), card_data['name'], colors['text'], *name_style, text_width)
             if card_data.get('job_title'):
-                draw.text((50, 125), card_data.get('job_title', ''), fill=colors['accent'], font=title_font)
+                self.draw_fitted_text(draw, (50, 125), card_data['job_title'], colors['accent'], *title_style, text_width)
             if card_data.get('company'):
-                draw.text((50, 165), card_data.get('company', ''), fill=colors['highlight'], font=title_font)
+                self.draw_fitted_text(draw, (50, 165), card_data['company'], colors['highlight'], *title_style, text_width)
             
             # Contact info for default template with better spacing
             y_pos = 200
             for field in ['email', 'phone', 'website', 'address']:
                 if card_data.get(field):
-                    draw.text((50, y_pos), card_data[field], fill=colors['light'], font=contact_font)
-                    y_pos += 38
+                    lines = self.draw_fitted_text(draw, (50, y_pos), card_data[field], colors['light'], *contact_style, text_width,
+                                                   max_lines=2 if field == 'address' else 1)
+                    y_pos += 38 * lines
             
             # Logo and QR for default template
             if logo_img:
@@ -0,0 +1,147 @@
+import pytest
+from PIL import Image, ImageDraw
+from card_generator import CardGenerator
+
+MAX_WIDTH = 860
+LONG_NAME = "Maximilian Alexander Worthington-Smythe the Third of Somewhere Far Away"
+LONG_ADDRESS = ("1234 Very Long Boulevard Name, Suite 5678, Metropolis City, "
+                "State 12345, United Kingdom of Great Britain")
+
+
+@pytest.fixture
+def generator():
+    return CardGenerator()
+
+
+@pytest.fixture
+def layout(generator):
+    return generator.text_layout
+
+
+def assert_fits(layout, font_family, size, lines, max_width):
+    for line in lines:
+        assert '\n' not in line
+        assert layout.text_length(font_family, size, line) <= max_width
+
+
+def test_text_that_fits_keeps_its_size(layout):
+    assert layout.fit('Jane Doe', 'sans_modern', 36, MAX_WIDTH) == (36, ('Jane Doe',))
+
+
+def test_long_text_shrinks_but_not_below_min_scale(layout):
+    text = 'Senior Vice President of Partnerships'
+    max_width = int(layout.text_length('sans_modern', 36, text) * 0.8)
+
+    size, lines = layout.fit(text, 'sans_modern', 36, max_width)
+
+    assert int(36 * layout.min_scale) <= size < 36
+    assert lines == (text,)
+    assert_fits(layout, 'sans_modern', size, lines, max_width)
+
+
+def test_address_wraps_onto_two_lines(layout):
+    size, lines = layout.fit(LONG_ADDRESS, 'sans_modern', 28, MAX_WIDTH, max_lines=2)
+
+    assert size > int(28 * layout.min_scale)
+    assert len(lines) == 2
+    assert ' '.join(lines) == LONG_ADDRESS
+    assert_fits(layout, 'sans_modern', size, lines, MAX_WIDTH)
+
+
+@pytest.mark.parametrize('overflow', [1.05, 1.2, 1.4, 1.6])
+def test_slightly_long_address_wraps_at_full_size(layout, overflow):
+    address = '1234 Very Long Boulevard Name, Suite 5678, Metropolis City, State 12345, United Kingdom'
+    max_width = int(layout.text_length('sans_modern', 28, address) / overflow)
+
+    size, lines = layout.fit(address, 'sans_modern', 28, max_width, max_lines=2)
+
+    assert size == 28
+    assert len(lines) == 2
+    assert ' '.join(lines) == address
+    assert_fits(layout, 'sans_modern', size, lines, max_width)
+
+
+@pytest.mark.parametrize('font_family, size', [('sans_modern', 28), ('serif_elegant', 36)])
+def test_longer_text_never_gets_a_larger_size(layout, font_family, size):
+    text = LONG_ADDRESS + ', Northern Ireland, Europe'
+    previous = size
+    for end in range(1, len(text) + 1):
+        fitted_size, lines = layout.fit(text[:end], font_family, size, MAX_WIDTH, max_lines=2)
+        assert fitted_size <= previous, text[:end]
+        assert_fits(layout, font_family, fitted_size, lines, MAX_WIDTH)
+        previous = fitted_size
+
+
+def test_overflowing_text_is_truncated_with_ellipsis(layout):
+    size, lines = layout.fit(LONG_NAME, 'serif_elegant', 72, MAX_WIDTH)
+
+    assert size == int(72 * layout.min_scale)
+    assert len(lines) == 1
+    assert lines[0].endswith('…')
+    assert LONG_NAME.startswith(lines[0][:-1])
+    assert_fits(layout, 'serif_elegant', size, lines, MAX_WIDTH)
+
+
+def test_newlines_are_hard_line_breaks(layout):
+    assert layout.fit('12 Main St\nSpringfield', 'sans_modern', 28, MAX_WIDTH, max_lines=2) == \
+        (28, ('12 Main St', 'Springfield'))
+    assert layout.fit('12 Main St\r\n\nSpringfield\nUSA', 'sans_modern', 28, MAX_WIDTH, max_lines=2) == \
+        (28, ('12 Main St', 'Springfield USA'))
+    assert layout.fit('12 Main St\nSpringfield', 'sans_modern', 28, MAX_WIDTH) == \
+        (28, ('12 Main St Springfield',))
+
+    size, lines = layout.fit(LONG_ADDRESS + '\n' + LONG_ADDRESS, 'sans_modern', 28, MAX_WIDTH, max_lines=2)
+    assert len(lines) == 2
+    assert_fits(layout, 'sans_modern', size, lines, MAX_WIDTH)
+
+
+@pytest.mark.parametrize('template', ['executive_premium', 'modern_gradient', 'minimalist_pro', 'other'])
+def test_templates_draw_multiline_fields(generator, template, monkeypatch):
+    draw = ImageDraw.Draw(Image.new('RGB', (generator.card_width, generator.card_height)))
+    card_data = {'name': 'Jane\nDoe', 'address': '12 Main St\nSpringfield'}
+    line_counts = {}
+    positions = {}
+    draw_fitted_text = generator.draw_fitted_text
+    text = draw.text
+
+    def recording_draw_fitted_text(draw, position, value, *args, **kwargs):
+        line_counts[value] = draw_fitted_text(draw, position, value, *args, **kwargs)
+        return line_counts[value]
+
+    def recording_text(xy, value, *args, **kwargs):
+        positions[value] = xy
+        return text(xy, value, *args, **kwargs)
+
+    monkeypatch.setattr(generator, 'draw_fitted_text', recording_draw_fitted_text)
+    monkeypatch.setattr(draw, 'text', recording_text)
+
+    generator.apply_template(draw, card_data, generator.color_schemes['executive_navy'], template)
+
+    assert line_counts == {'Jane\nDoe': 1, '12 Main St\nSpringfield': 2}
+    assert 'Jane Doe' in positions
+    street_x, street_y = positions['12 Main St']
+    city_x, city_y = positions['Springfield']
+    assert city_x == street_x
+    assert city_y > street_y
+
+
+def test_repeated_strings_are_measured_once(layout, monkeypatch):
+    calls = []
+    textlength = layout._draw.textlength
+
+    def counting_textlength(text, font=None, **kwargs):
+        calls.append((text, font.size))
+        return textlength(text, font=font, **kwargs)
+
+    monkeypatch.setattr(layout._draw, 'textlength', counting_textlength)
+    rows = [('Acme Holdings International Group', 1), (LONG_NAME, 1), (LONG_ADDRESS, 2)]
+
+    for text, max_lines in rows:
+        layout.fit(text, 'sans_modern', 36, MAX_WIDTH, max_lines)
+    assert len(calls) == len(set(calls))
+
+    measured = len(calls)
+    for _ in range(3):
+        for text, max_lines in rows:
+            layout.fit(text, 'sans_modern', 36, MAX_WIDTH, max_lines)
+    assert len(calls) == measured